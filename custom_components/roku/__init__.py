@@ -1,6 +1,7 @@
 """Support for Roku."""
 from __future__ import annotations
 
+from functools import wraps
 import logging
 
 from rokuecp import RokuConnectionError, RokuError
@@ -21,11 +22,15 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Roku from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-    if not (coordinator := hass.data[DOMAIN].get(entry.entry_id)):
-        coordinator = RokuDataUpdateCoordinator(hass, host=entry.data[CONF_HOST])
-        hass.data[DOMAIN][entry.entry_id] = coordinator
-
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if not (coordinator := domain_data.get(entry.entry_id)):
+        coordinator = domain_data[entry.entry_id] = RokuDataUpdateCoordinator(
+            hass, host=entry.data[CONF_HOST]
+        )
+
+    # Platforms read coordinator.data while setting up their entities, and a
+    # failed first refresh must raise ConfigEntryNotReady before any platform
+    # is forwarded, so this cannot overlap with async_setup_platforms.
     await coordinator.async_config_entry_first_refresh()
 
     hass.config_entries.async_setup_platforms(entry, PLATFORMS)
@@ -44,14 +49,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 def roku_exception_handler(func):
     """Decorate Roku calls to handle Roku exceptions."""
 
+    @wraps(func)
     async def handler(self, *args, **kwargs):
         try:
-            await func(self, *args, **kwargs)
-        except RokuConnectionError as error:
-            if self.available:
-                _LOGGER.error("Error communicating with API: %s", error)
-        except RokuError as error:
+            return await func(self, *args, **kwargs)
+        except (RokuConnectionError, RokuError) as error:
             if self.available:
-                _LOGGER.error("Invalid response from API: %s", error)
+                _LOGGER.error("Roku API error in %s: %s", func.__name__, error)
 
     return handler
@@ -1,6 +1,11 @@
 """Base Entity for Roku."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Coroutine
+from functools import partial
+from typing import Any
+
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -19,6 +24,29 @@ class RokuEntity(CoordinatorEntity):
         """Initialize the Roku entity."""
         super().__init__(coordinator)
         self._device_id = device_id
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def _single_flight(
+        self, key: str, coro_factory: Callable[[], Coroutine[Any, Any, None]]
+    ) -> None:
+        """Run an operation once for all concurrent callers sharing a key."""
+        if (task := self._inflight.get(key)) is not None and not task.done():
+            await asyncio.shield(task)
+            return
+
+        task = self.hass.async_create_task(coro_factory())
+        self._inflight[key] = task
+        task.add_done_callback(partial(self._inflight_done, key))
+        await asyncio.shield(task)
+
+    def _inflight_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished in-flight operation."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _async_remote(self, key: str) -> None:
+        """Send a remote key press, sharing it with identical in-flight presses."""
+        await self._single_flight(key, lambda: self.coordinator.roku.remote(key))
 
     @property
     def device_info(self) -> DeviceInfo:
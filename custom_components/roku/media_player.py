@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import datetime as dt
+from functools import cached_property, lru_cache
 import logging
+from typing import Final
 
+from rokuecp.models import Application
 import voluptuous as vol
 
 from urllib.parse import quote
@@ -41,8 +44,10 @@ from homeassistant.const import (
     STATE_PLAYING,
     STATE_STANDBY,
 )
-from homeassistant.helpers import entity_platform
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.network import is_internal_request
+from homeassistant.util.dt import utcnow
 
 from . import roku_exception_handler
 from .browse_media import build_item_response, library_payload
@@ -52,7 +57,7 @@ from .entity import RokuEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-SUPPORT_ROKU = (
+SUPPORT_ROKU: Final[int] = (
     SUPPORT_PREVIOUS_TRACK
     | SUPPORT_NEXT_TRACK
     | SUPPORT_VOLUME_STEP
@@ -66,7 +71,28 @@ SUPPORT_ROKU = (
     | SUPPORT_BROWSE_MEDIA
 )
 
-SEARCH_SCHEMA = {vol.Required(ATTR_KEYWORD): str}
+_HIDDEN_APPS: Final[frozenset[str]] = frozenset({"Power Saver", "Roku"})
+
+_APP_STATE: Final[dict[str, str]] = {
+    "Power Saver": STATE_IDLE,
+    "Roku": STATE_HOME,
+}
+
+# How long an optimistic state is kept while the device still reports standby.
+OPTIMISTIC_STATE_TIMEOUT: Final = dt.timedelta(seconds=30)
+
+# Properties cached for the lifetime of one coordinator update.
+_CACHED_ATTRIBUTES: Final = ("app_id", "app_name", "source")
+
+SEARCH_SCHEMA: Final = cv.make_entity_service_schema(
+    {vol.Required(ATTR_KEYWORD): cv.string}
+)
+
+
+@lru_cache(maxsize=128)
+def _quote_all(value: str) -> str:
+    """Percent-encode a deep link value, including reserved characters."""
+    return quote(value, safe="")
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -97,18 +123,72 @@ class RokuMediaPlayer(RokuEntity, MediaPlayerEntity):
         self._attr_name = coordinator.data.info.name
         self._attr_unique_id = unique_id
         self._attr_supported_features = SUPPORT_ROKU
+        self._last_fp: tuple | None = None
+        self._source_list_cache: tuple[list | None, list | None] = (None, None)
+        self._apps_index_key: list | None = None
+        self._apps_index: dict[str, Application] = {}
+        self._optimistic_state: str | None = None
+        self._optimistic_state_at: dt.datetime | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a surfaced attribute has changed."""
+        for attr in _CACHED_ATTRIBUTES:
+            self.__dict__.pop(attr, None)
+
+        data = self.coordinator.data
+        if self._optimistic_state is not None and (
+            not data.state.standby
+            or utcnow() - self._optimistic_state_at >= OPTIMISTIC_STATE_TIMEOUT
+        ):
+            self._optimistic_state = None
+
+        fp = (
+            self._optimistic_state,
+            self.coordinator.last_update_success,
+            data.state.standby,
+            getattr(data.app, "app_id", None),
+            getattr(data.app, "name", None),
+            getattr(data.app, "screensaver", None),
+            getattr(data.media, "paused", None),
+            getattr(data.media, "position", None),
+            getattr(data.media, "duration", None),
+            getattr(data.media, "live", None),
+            getattr(data.channel, "name", None),
+            getattr(data.channel, "number", None),
+            getattr(data.channel, "program_title", None),
+            data.apps,
+        )
+        if fp == self._last_fp:
+            return
+
+        self._last_fp = fp
+        super()._handle_coordinator_update()
 
     def _media_playback_trackable(self) -> bool:
         """Detect if we have enough media data to track playback."""
-        if self.coordinator.data.media is None or self.coordinator.data.media.live:
-            return False
-
-        return self.coordinator.data.media.duration > 0
+        return (
+            media := self.coordinator.data.media
+        ) is not None and not media.live and media.duration > 0
+
+    def _get_apps_index(self) -> dict[str, Application]:
+        """Return installed apps indexed by both name and app id."""
+        apps = self.coordinator.data.apps
+        if self._apps_index_key is not apps:
+            index: dict[str, Application] = {}
+            for app in apps:
+                index.setdefault(app.name, app)
+                index.setdefault(app.app_id, app)
+            self._apps_index = index
+            self._apps_index_key = apps
+
+        return self._apps_index
 
     @property
     def device_class(self) -> str | None:
         """Return the class of this device."""
-        if self.coordinator.data.info.device_type == "tv":
+        info = self.coordinator.data.info
+        if info.device_type == "tv":
             return MediaPlayerDeviceClass.TV
 
         return MediaPlayerDeviceClass.RECEIVER
@@ -116,27 +196,29 @@ class RokuMediaPlayer(RokuEntity, MediaPlayerEntity):
     @property
     def state(self) -> str | None:
         """Return the state of the device."""
-        if self.coordinator.data.state.standby:
+        data = self.coordinator.data
+        if data.state.standby:
+            if self._optimistic_state is not None:
+                return self._optimistic_state
             return STATE_STANDBY
 
-        if self.coordinator.data.app is None:
+        app = data.app
+        if app is None:
             return None
 
-        if (
-            self.coordinator.data.app.name == "Power Saver"
-            or self.coordinator.data.app.screensaver
-        ):
+        if app.screensaver:
             return STATE_IDLE
 
-        if self.coordinator.data.app.name == "Roku":
-            return STATE_HOME
+        name = app.name
+        if (app_state := _APP_STATE.get(name)) is not None:
+            return app_state
 
-        if self.coordinator.data.media:
-            if self.coordinator.data.media.paused:
+        if data.media:
+            if data.media.paused:
                 return STATE_PAUSED
             return STATE_PLAYING
 
-        if self.coordinator.data.app.name:
+        if name:
             return STATE_ON
 
         return None
@@ -144,10 +226,12 @@ class RokuMediaPlayer(RokuEntity, MediaPlayerEntity):
     @property
     def media_content_type(self) -> str | None:
         """Content type of current playing media."""
-        if self.app_id is None or self.app_name in ("Power Saver", "Roku"):
+        app_id = self.app_id
+        if app_id is None or self.app_name in _HIDDEN_APPS:
             return None
 
-        if self.app_id == "tvinput.dtv" and self.coordinator.data.channel is not None:
+        channel = self.coordinator.data.channel
+        if app_id == "tvinput.dtv" and channel is not None:
             return MEDIA_TYPE_CHANNEL
 
         return MEDIA_TYPE_APP
@@ -155,85 +239,102 @@ class RokuMediaPlayer(RokuEntity, MediaPlayerEntity):
     @property
     def media_image_url(self) -> str | None:
         """Image url of current playing media."""
-        if self.app_id is None or self.app_name in ("Power Saver", "Roku"):
+        app_id = self.app_id
+        if app_id is None or self.app_name in _HIDDEN_APPS:
             return None
 
-        return self.coordinator.roku.app_icon_url(self.app_id)
+        return self.coordinator.roku.app_icon_url(app_id)
 
-    @property
+    @cached_property
     def app_name(self) -> str | None:
         """Name of the current running app."""
-        if self.coordinator.data.app is not None:
-            return self.coordinator.data.app.name
+        app = self.coordinator.data.app
+        if app is not None:
+            return app.name
 
         return None
 
-    @property
+    @cached_property
     def app_id(self) -> str | None:
         """Return the ID of the current running app."""
-        if self.coordinator.data.app is not None:
-            return self.coordinator.data.app.app_id
+        app = self.coordinator.data.app
+        if app is not None:
+            return app.app_id
 
         return None
 
     @property
     def media_channel(self) -> str | None:
         """Return the TV channel currently tuned."""
-        if self.app_id != "tvinput.dtv" or self.coordinator.data.channel is None:
+        channel = self.coordinator.data.channel
+        if self.app_id != "tvinput.dtv" or channel is None:
             return None
 
-        if self.coordinator.data.channel.name is not None:
-            return f"{self.coordinator.data.channel.name} ({self.coordinator.data.channel.number})"
+        if channel.name is not None:
+            return f"{channel.name} ({channel.number})"
 
-        return self.coordinator.data.channel.number
+        return channel.number
 
     @property
     def media_title(self) -> str | None:
         """Return the title of current playing media."""
-        if self.app_id != "tvinput.dtv" or self.coordinator.data.channel is None:
+        channel = self.coordinator.data.channel
+        if self.app_id != "tvinput.dtv" or channel is None:
             return None
 
-        if self.coordinator.data.channel.program_title is not None:
-            return self.coordinator.data.channel.program_title
+        if channel.program_title is not None:
+            return channel.program_title
 
         return None
 
     @property
     def media_duration(self) -> int | None:
         """Duration of current playing media in seconds."""
+        media = self.coordinator.data.media
         if self._media_playback_trackable():
-            return self.coordinator.data.media.duration
+            return media.duration
 
         return None
 
     @property
     def media_position(self) -> int | None:
         """Position of current playing media in seconds."""
+        media = self.coordinator.data.media
         if self._media_playback_trackable():
-            return self.coordinator.data.media.position
+            return media.position
 
         return None
 
     @property
     def media_position_updated_at(self) -> dt.datetime | None:
         """When was the position of the current playing media valid."""
+        media = self.coordinator.data.media
         if self._media_playback_trackable():
-            return self.coordinator.data.media.at
+            return media.at
 
         return None
 
-    @property
+    @cached_property
     def source(self) -> str | None:
         """Return the current input source."""
-        if self.coordinator.data.app is not None:
-            return self.coordinator.data.app.name
+        app = self.coordinator.data.app
+        if app is not None:
+            return app.name
 
         return None
 
     @property
     def source_list(self) -> list:
         """List of available input sources."""
-        return ["Home"] + sorted(app.name for app in self.coordinator.data.apps)
+        apps = self.coordinator.data.apps
+        if self._source_list_cache[0] is apps:
+            return self._source_list_cache[1]
+
+        names = [app.name for app in apps]
+        names.sort()
+        names.insert(0, "Home")
+        self._source_list_cache = (apps, names)
+        return names
 
     @roku_exception_handler
     async def search(self, keyword):
@@ -253,34 +354,37 @@ class RokuMediaPlayer(RokuEntity, MediaPlayerEntity):
 
         return (None, None)
 
+    def _get_internal_thumbnail_url(
+        self,
+        media_content_type: str,
+        media_content_id: str,
+        media_image_id: str | None = None,
+    ) -> str | None:
+        """Return a direct thumbnail url for internal browse requests."""
+        if media_content_type == MEDIA_TYPE_APP and media_content_id:
+            return self.coordinator.roku.app_icon_url(media_content_id)
+
+        return None
+
     async def async_browse_media(
         self,
         media_content_type: str | None = None,
         media_content_id: str | None = None,
     ) -> BrowseMedia:
         """Implement the websocket media browsing helper."""
-        is_internal = is_internal_request(self.hass)
-
-        def _get_thumbnail_url(
-            media_content_type, media_content_id, media_image_id=None
-        ):
-            if is_internal:
-                if media_content_type == MEDIA_TYPE_APP and media_content_id:
-                    return self.coordinator.roku.app_icon_url(media_content_id)
-                return None
-
-            return self.get_browse_image_url(
-                media_content_type, media_content_id, media_image_id
-            )
+        if is_internal_request(self.hass):
+            get_thumbnail_url = self._get_internal_thumbnail_url
+        else:
+            get_thumbnail_url = self.get_browse_image_url
 
         if media_content_type in [None, "library"]:
-            return library_payload(self.coordinator, _get_thumbnail_url)
+            return library_payload(self.coordinator, get_thumbnail_url)
 
         payload = {
             "search_type": media_content_type,
             "search_id": media_content_id,
         }
-        response = build_item_response(self.coordinator, payload, _get_thumbnail_url)
+        response = build_item_response(self.coordinator, payload, get_thumbnail_url)
 
         if response is None:
             raise BrowseError(
@@ -292,53 +396,56 @@ class RokuMediaPlayer(RokuEntity, MediaPlayerEntity):
     @roku_exception_handler
     async def async_turn_on(self) -> None:
         """Turn on the Roku."""
-        await self.coordinator.roku.remote("poweron")
-        await self.coordinator.async_request_refresh()
+        await self._async_remote("poweron")
+        if self.coordinator.data.state.standby:
+            # The device takes several seconds to wake up, so report it as on
+            # until a scheduled poll confirms it has left standby.
+            self._optimistic_state = STATE_ON
+            self._optimistic_state_at = utcnow()
+            self.async_write_ha_state()
 
     @roku_exception_handler
     async def async_turn_off(self) -> None:
         """Turn off the Roku."""
-        await self.coordinator.roku.remote("poweroff")
-        await self.coordinator.async_request_refresh()
+        await self._async_remote("poweroff")
+        self._optimistic_state = None
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     @roku_exception_handler
     async def async_media_pause(self) -> None:
         """Send pause command."""
         if self.state not in (STATE_STANDBY, STATE_PAUSED):
-            await self.coordinator.roku.remote("play")
-            await self.coordinator.async_request_refresh()
+            await self._async_remote("play")
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     @roku_exception_handler
     async def async_media_play(self) -> None:
         """Send play command."""
         if self.state not in (STATE_STANDBY, STATE_PLAYING):
-            await self.coordinator.roku.remote("play")
-            await self.coordinator.async_request_refresh()
+            await self._async_remote("play")
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     @roku_exception_handler
     async def async_media_play_pause(self) -> None:
         """Send play/pause command."""
         if self.state != STATE_STANDBY:
-            await self.coordinator.roku.remote("play")
-            await self.coordinator.async_request_refresh()
+            await self._async_remote("play")
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     @roku_exception_handler
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
         await self.coordinator.roku.remote("reverse")
-        await self.coordinator.async_request_refresh()
 
     @roku_exception_handler
     async def async_media_next_track(self) -> None:
         """Send next track command."""
         await self.coordinator.roku.remote("forward")
-        await self.coordinator.async_request_refresh()
 
     @roku_exception_handler
     async def async_mute_volume(self, mute) -> None:
         """Mute the volume."""
         await self.coordinator.roku.remote("volume_mute")
-        await self.coordinator.async_request_refresh()
 
     @roku_exception_handler
     async def async_volume_up(self) -> None:
@@ -363,40 +470,33 @@ class RokuMediaPlayer(RokuEntity, MediaPlayerEntity):
             return
 
         if media_type == MEDIA_TYPE_APP:
-            media_array = media_id.split(",")
-            if len(media_array) > 1:
-                app_id = media_array[0].strip()
-                content_id = media_array[1].strip()
+            head, sep, tail = media_id.partition(",")
+            if sep:
+                app_id = head.strip()
+                content_id = tail.split(",", 1)[0].strip()
                 _LOGGER.info("Launching Roku app %s with deep link %s", app_id, content_id)
-                await self.coordinator.roku.launch(app_id, {"contentId": quote(content_id, safe="")})
+                await self.coordinator.roku.launch(app_id, {"contentId": _quote_all(content_id)})
             else:
                 _LOGGER.info("Launching Roku app %s", media_id)
                 await self.coordinator.roku.launch(media_id)
         elif media_type == FORMAT_CONTENT_TYPE[HLS_PROVIDER]:
             _LOGGER.info("Launching Roku side loaded app with deep link %s", media_id)
-            await self.coordinator.roku.launch("dev", {"contentId": quote(media_id, safe="")})
+            await self.coordinator.roku.launch("dev", {"contentId": _quote_all(media_id)})
         elif media_type == MEDIA_TYPE_CHANNEL:
             _LOGGER.info("Switching to Roku TV channel %s", media_id)
             await self.coordinator.roku.tune(media_id)
 
-        await self.coordinator.async_request_refresh()
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     @roku_exception_handler
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
         if source == "Home":
-            await self.coordinator.roku.remote("home")
-
-        appl = next(
-            (
-                app
-                for app in self.coordinator.data.apps
-                if source in (app.name, app.app_id)
-            ),
-            None,
-        )
+            await self._async_remote("home")
+
+        appl = self._get_apps_index().get(source)
 
         if appl is not None:
             await self.coordinator.roku.launch(appl.app_id)
 
-        await self.coordinator.async_request_refresh()
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
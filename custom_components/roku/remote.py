@@ -1,9 +1,11 @@
 """Support for the Roku remote."""
 from __future__ import annotations
 
+from itertools import chain, repeat
+
 from homeassistant.components.remote import ATTR_NUM_REPEATS, RemoteEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import roku_exception_handler
@@ -35,6 +37,20 @@ class RokuRemote(RokuEntity, RemoteEntity):
 
         self._attr_name = coordinator.data.info.name
         self._attr_unique_id = unique_id
+        self._last_fp: tuple | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the power state has changed."""
+        fp = (
+            self.coordinator.last_update_success,
+            self.coordinator.data.state.standby,
+        )
+        if fp == self._last_fp:
+            return
+
+        self._last_fp = fp
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool:
@@ -44,22 +60,21 @@ class RokuRemote(RokuEntity, RemoteEntity):
     @roku_exception_handler
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the device on."""
-        await self.coordinator.roku.remote("poweron")
-        await self.coordinator.async_request_refresh()
+        await self._async_remote("poweron")
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     @roku_exception_handler
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the device off."""
-        await self.coordinator.roku.remote("poweroff")
-        await self.coordinator.async_request_refresh()
+        await self._async_remote("poweroff")
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     @roku_exception_handler
     async def async_send_command(self, command: list, **kwargs) -> None:
         """Send a command to one device."""
         num_repeats = kwargs[ATTR_NUM_REPEATS]
 
-        for _ in range(num_repeats):
-            for single_command in command:
-                await self.coordinator.roku.remote(single_command)
+        for single_command in chain.from_iterable(repeat(command, num_repeats)):
+            await self.coordinator.roku.remote(single_command)
 
-        await self.coordinator.async_request_refresh()
+        self.hass.async_create_task(self.coordinator.async_request_refresh())